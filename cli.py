@@ -6,8 +6,9 @@ Run: python cli.py --help
 
 import os
 import sys
+import atexit
 import argparse
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "db" / "factory.db"
@@ -15,6 +16,35 @@ TOOL_TEMPLATES = Path(__file__).parent / "tool_templates"
 GENERATED_TOOLS = Path(__file__).parent / "generated_tools"
 CONTENT_RENDERS = Path(__file__).parent / "content" / "renders"
 
+_CONN = None
+_SESSION = None
+
+# Recurring statements, kept as constants so the connection's statement
+# cache always sees the same SQL text
+_SQL_INSERT_TOOL = "INSERT INTO tools (slug, name, niche, build_path, status) VALUES (?, ?, ?, ?, ?)"
+_SQL_INSERT_PRODUCT = "INSERT INTO products (tool_id, platform, product_id, url, price) VALUES (?, ?, ?, ?, ?)"
+_SQL_INSERT_CONTENT = """INSERT INTO content 
+    (tool_id, platform, video_path, caption, hashtags, status) 
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_UPDATE_CONTENT_STATUS = "UPDATE content SET status = ?, posted_at = CURRENT_TIMESTAMP WHERE id = ?"
+_SQL_RELEASE_CLAIM = "UPDATE content SET status = 'generated' WHERE id = ? AND status = 'claimed'"
+
+_CAPTION_TEMPLATE = (
+    "🔥 Free {name} - Link in bio!\n\n"
+    "Calculate your profits instantly with this free tool.\n"
+    "#free #calculator #profit #business #{slug}"
+)
+_HASHTAGS_TEMPLATE = "#{slug_nodash} #profit #calculator #free #tool"
+
+# LemonSqueezy product payload with the invariant JSON scaffold
+# pre-serialized; only the per-tool values are encoded per call
+_LS_PRODUCT_TEMPLATE = (
+    '{{"data":{{"type":"products","attributes":{{'
+    '"name":{name},"price":{price},"price_formatted":{price_formatted},'
+    '"description":{description},"slug":{slug},"status":"published"}},'
+    '"relationships":{{"store":{{"data":{{"type":"stores","id":{store_id}}}}}}}}}}}'
+)
+
 def ensure_env():
     """Check .env exists"""
     env_file = Path(__file__).parent / ".env"
@@ -23,17 +53,58 @@ def ensure_env():
         return False
     return True
 
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env once per process"""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return True
+
+def _get_conn():
+    """Return the process-wide SQLite connection, opening it on first use"""
+    global _CONN
+    if _CONN is None:
+        import sqlite3
+        
+        # Autocommit mode; write paths open their transactions explicitly
+        _CONN = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+        _CONN.execute("PRAGMA journal_mode = WAL")
+        _CONN.execute("PRAGMA synchronous = NORMAL")
+        _CONN.execute("PRAGMA busy_timeout = 5000")
+        _CONN.execute("PRAGMA foreign_keys = ON")
+        _CONN.execute("PRAGMA temp_store = MEMORY")
+        _CONN.execute("PRAGMA cache_size = -20000")
+    return _CONN
+
+atexit.register(lambda: _CONN and _CONN.close())
+
+def _get_session():
+    """Return a shared requests.Session with connection pooling and retries"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+    return _SESSION
+
 def init_db(args=None):
     """Initialize SQLite database and folders"""
-    import sqlite3
-    
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     GENERATED_TOOLS.mkdir(parents=True, exist_ok=True)
     CONTENT_RENDERS.mkdir(parents=True, exist_ok=True)
     
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     
+    conn.execute("BEGIN")
     c.execute("""
         CREATE TABLE IF NOT EXISTS tools (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -89,11 +160,50 @@ def init_db(args=None):
         )
     """)
     
+    # Indexes for the content queue lookups and per-tool joins
+    for stmt in [
+        "CREATE INDEX IF NOT EXISTS idx_content_status_platform ON content(status, platform)",
+        "CREATE INDEX IF NOT EXISTS idx_content_tool ON content(tool_id)",
+        # Partial index over the pending queue only
+        "CREATE INDEX IF NOT EXISTS idx_content_generated ON content(platform, id) WHERE status = 'generated'",
+        # Covers the per-tool revenue/sales aggregation; supersedes idx_metrics_tool
+        "DROP INDEX IF EXISTS idx_metrics_tool",
+        "CREATE INDEX IF NOT EXISTS idx_metrics_tool_rev ON metrics(tool_id, revenue, sales)",
+        "CREATE INDEX IF NOT EXISTS idx_products_tool ON products(tool_id)"
+    ]:
+        c.execute(stmt)
+    
     conn.commit()
-    conn.close()
+    
+    # Refresh planner statistics so the new indexes get used
+    c.execute("ANALYZE")
     print(f"✅ Database initialized at {DB_PATH}")
     print(f"✅ Folders created")
 
+def _fast_copy(src, dst):
+    """Copy a template file, sharing extents (reflink) where the filesystem can
+    
+    Copy-on-write keeps the speed of a link without tying the copy to the
+    template: generated tools get hand-edited after build.
+    """
+    import shutil
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
 def build_tool(args):
     """Build a tool from template"""
     import shutil
@@ -113,8 +223,8 @@ def build_tool(args):
         print(f"❌ Tool '{slug}' already exists. Delete folder or use different slug.")
         return
     
-    # Copy template
-    shutil.copytree(template_path, output_path)
+    # Copy template (reflinked where supported)
+    shutil.copytree(template_path, output_path, copy_function=_fast_copy)
     
     # Update config
     config = {
@@ -127,13 +237,12 @@ def build_tool(args):
         json.dump(config, f)
     
     # Add to DB
-    import sqlite3
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
-    c.execute("INSERT INTO tools (slug, name, niche, build_path, status) VALUES (?, ?, ?, ?, ?)",
+    conn.execute("BEGIN")
+    c.execute(_SQL_INSERT_TOOL,
               (slug, slug.replace("-", " ").title(), niche, str(output_path), "built"))
     conn.commit()
-    conn.close()
     
     print(f"✅ Built '{slug}' from template '{template}'")
     print(f"   Location: {output_path}")
@@ -141,18 +250,16 @@ def build_tool(args):
 
 def publish_product(args):
     """Publish tool to LemonSqueezy or Gumroad"""
-    import requests
-    from dotenv import load_dotenv
+    import json
     
-    load_dotenv()
+    _load_env()
     
     slug = args.tool
     platform = args.platform
     price = args.price or 29
     
     # Get tool from DB
-    import sqlite3
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     c.execute("SELECT id, slug, name, niche FROM tools WHERE slug = ?", (slug,))
     row = c.fetchone()
@@ -177,32 +284,23 @@ def publish_product(args):
             "Content-Type": "application/vnd.api+json",
             "Accept": "application/vnd.api+json"
         }
-        data = {
-            "data": {
-                "type": "products",
-                "attributes": {
-                    "name": name,
-                    "price": price * 100,  # cents
-                    "price_formatted": f"${price}.00",
-                    "description": f"A simple {slug} tool for {niche}",
-                    "slug": slug,
-                    "status": "published"
-                },
-                "relationships": {
-                    "store": {
-                        "data": {"type": "stores", "id": store_id}
-                    }
-                }
-            }
-        }
+        data = _LS_PRODUCT_TEMPLATE.format(
+            name=json.dumps(name),
+            price=json.dumps(price * 100),  # cents
+            price_formatted=json.dumps(f"${price}.00"),
+            description=json.dumps(f"A simple {slug} tool for {niche}"),
+            slug=json.dumps(slug),
+            store_id=json.dumps(store_id)
+        ).encode()
         
-        resp = requests.post(url, headers=headers, json=data)
+        resp = _get_session().post(url, headers=headers, data=data, timeout=(3.05, 30))
         if resp.status_code in [200, 201]:
             result = resp.json()
             product_id = result["data"]["id"]
             checkout_url = result["data"]["attributes"]["urls"]["checkout_url"]
             
-            c.execute("INSERT INTO products (tool_id, platform, product_id, url, price) VALUES (?, ?, ?, ?, ?)",
+            conn.execute("BEGIN")
+            c.execute(_SQL_INSERT_PRODUCT,
                       (tool_id, platform, product_id, checkout_url, price))
             conn.commit()
             print(f"✅ Product published to LemonSqueezy")
@@ -210,7 +308,6 @@ def publish_product(args):
         else:
             print(f"❌ Failed: {resp.text}")
     
-    conn.close()
 
 def generate_content(args):
     """Generate demo content for a tool"""
@@ -218,8 +315,7 @@ def generate_content(args):
     platforms = args.platform.split(",") if args.platform else ["youtube"]
     count = args.count or 1
     
-    import sqlite3
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     c.execute("SELECT id, slug, name FROM tools WHERE slug = ?", (slug,))
     row = c.fetchone()
@@ -229,113 +325,130 @@ def generate_content(args):
     tool_id, slug, name = row
     
     # Generate caption
-    caption = f"🔥 Free {name} - Link in bio!\n\n"
-    caption += f"Calculate your profits instantly with this free tool.\n"
-    caption += f"#free #calculator #profit #business #{slug}"
-    
-    hashtags = f"#{slug.replace('-', '')} #profit #calculator #free #tool"
+    caption = _CAPTION_TEMPLATE.format(name=name, slug=slug)
+    hashtags = _HASHTAGS_TEMPLATE.format(slug_nodash=slug.replace("-", ""))
+    
+    # Create placeholders (in real version, would generate video)
+    render_prefix = os.path.join(str(CONTENT_RENDERS), f"{slug}_")
+    rows = [(tool_id, platform, f"{render_prefix}{platform}_{i+1}.mp4",
+             caption, hashtags, "generated")
+            for i in range(count) for platform in platforms]
+    
+    # Insert all rows in a single transaction
+    conn.execute("BEGIN")
+    c.executemany(_SQL_INSERT_CONTENT, rows)
+    conn.commit()
     
-    for i in range(count):
-        for platform in platforms:
-            # Create placeholder (in real version, would generate video)
-            video_path = CONTENT_RENDERS / f"{slug}_{platform}_{i+1}.mp4"
-            
-            c.execute("""INSERT INTO content 
-                (tool_id, platform, video_path, caption, hashtags, status) 
-                VALUES (?, ?, ?, ?, ?, ?)""",
-                (tool_id, platform, str(video_path), caption, hashtags, "generated"))
-            
-            print(f"✅ Generated content for {slug} - {platform}")
+    for row in rows:
+        print(f"✅ Generated content for {slug} - {row[1]}")
     
-    conn.commit()
-    conn.close()
     print(f"✅ Created {count} content item(s) for {platforms}")
 
 def post_content(args):
     """Post content to social platforms"""
     platforms = args.platform.split(",") if args.platform else ["youtube"]
     
-    import sqlite3
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     
+    supported = list(dict.fromkeys(p for p in platforms if p in ("youtube", "pinterest")))
     for platform in platforms:
-        c.execute("""SELECT c.id, c.tool_id, c.video_path, c.caption, c.hashtags, t.slug
-            FROM content c JOIN tools t ON c.tool_id = t.id
-            WHERE c.platform = ? AND c.status = 'generated' LIMIT 1""", (platform,))
-        
-        row = c.fetchone()
-        if not row:
-            print(f"⚠️ No pending content for {platform}")
-            continue
-        
-        content_id, tool_id, video_path, caption, hashtags, slug = row
-        
-        if platform == "youtube":
-            # YouTube API upload would go here
-            print(f"📺 YouTube: Would upload {video_path}")
-            print(f"   Title: {slug} - Free Calculator")
-            print(f"   Description: {caption}")
-            status = "posted"
-        
-        elif platform == "pinterest":
-            # Pinterest API would go here  
-            print(f"📌 Pinterest: Would create pin for {slug}")
-            status = "posted"
-        
-        else:
+        if platform not in supported:
             print(f"⚠️ Platform {platform} not supported")
-            continue
-        
-        c.execute("UPDATE content SET status = ?, posted_at = CURRENT_TIMESTAMP WHERE id = ?",
-                  (status, content_id))
-        conn.commit()
-        print(f"✅ Posted to {platform}")
+    if not supported:
+        return
     
-    conn.close()
+    # Claim the next item for every platform in one query, under a write
+    # lock so concurrent runs never pick the same row
+    placeholders = ",".join("?" * len(supported))
+    conn.execute("BEGIN IMMEDIATE")
+    c.execute(f"""SELECT c.id, c.tool_id, c.platform, c.video_path, c.caption, c.hashtags, t.slug
+        FROM content c JOIN tools t ON c.tool_id = t.id
+        WHERE c.id IN (
+            SELECT MIN(id) FROM content
+            WHERE status = 'generated' AND platform IN ({placeholders})
+                AND EXISTS (SELECT 1 FROM tools WHERE tools.id = content.tool_id)
+            GROUP BY platform
+        )""", supported)
+    pending = {row[2]: row for row in c.fetchall()}
+    c.executemany("UPDATE content SET status = 'claimed' WHERE id = ?",
+                  [(row[0],) for row in pending.values()])
+    conn.commit()
+    
+    posted = []
+    try:
+        for platform in supported:
+            row = pending.get(platform)
+            if not row:
+                print(f"⚠️ No pending content for {platform}")
+                continue
+            
+            content_id, tool_id, platform, video_path, caption, hashtags, slug = row
+            
+            if platform == "youtube":
+                # YouTube API upload would go here
+                print(f"📺 YouTube: Would upload {video_path}")
+                print(f"   Title: {slug} - Free Calculator")
+                print(f"   Description: {caption}")
+                status = "posted"
+            
+            elif platform == "pinterest":
+                # Pinterest API would go here  
+                print(f"📌 Pinterest: Would create pin for {slug}")
+                status = "posted"
+            
+            conn.execute("BEGIN")
+            c.execute(_SQL_UPDATE_CONTENT_STATUS,
+                      (status, content_id))
+            conn.commit()
+            posted.append(content_id)
+            print(f"✅ Posted to {platform}")
+    except BaseException:
+        # Put unposted claims back in the queue, including on Ctrl-C
+        if conn.in_transaction:
+            conn.rollback()
+        conn.execute("BEGIN")
+        c.executemany(_SQL_RELEASE_CLAIM,
+                      [(row[0],) for row in pending.values() if row[0] not in posted])
+        conn.commit()
+        raise
 
 def analytics_report(args):
     """Show analytics report"""
-    import sqlite3
     from datetime import datetime, timedelta
     
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     
     print("\n📊 AI FACTORY ANALYTICS")
     print("=" * 40)
     
-    # Tools
-    c.execute("SELECT COUNT(*) FROM tools WHERE status = 'built'")
-    tools_count = c.fetchone()[0]
-    print(f"Tools built: {tools_count}")
+    # Header counts in a single statement
+    c.execute("""SELECT
+        (SELECT COUNT(*) FROM tools WHERE status = 'built'),
+        (SELECT COUNT(*) FROM products),
+        (SELECT COUNT(*) FROM content WHERE status = 'posted'),
+        (SELECT COUNT(*) FROM content),
+        COALESCE((SELECT SUM(revenue) FROM metrics), 0)""")
+    tools_count, products_count, posted, total_content, revenue = c.fetchone()
     
-    # Products
-    c.execute("SELECT COUNT(*) FROM products")
-    products_count = c.fetchone()[0]
+    print(f"Tools built: {tools_count}")
     print(f"Products published: {products_count}")
-    
-    # Content
-    c.execute("SELECT COUNT(*) FROM content WHERE status = 'posted'")
-    posted = c.fetchone()[0]
-    c.execute("SELECT COUNT(*) FROM content")
-    total_content = c.fetchone()[0]
     print(f"Content posted: {posted}/{total_content}")
-    
-    # Revenue
-    c.execute("SELECT SUM(revenue) FROM metrics")
-    revenue = c.fetchone()[0] or 0
     print(f"Total revenue: ${revenue:.2f}")
     
     # Top performers
     print("\n🏆 Top Tools (by revenue):")
-    c.execute("""SELECT t.slug, SUM(m.revenue) as rev, SUM(m.sales) as sales
-        FROM tools t JOIN metrics m ON t.id = m.tool_id
-        GROUP BY t.id ORDER BY rev DESC LIMIT 5""")
+    c.execute("""WITH agg AS (
+            SELECT tool_id, SUM(revenue) AS rev, SUM(sales) AS sales
+            FROM metrics GROUP BY tool_id ORDER BY rev DESC LIMIT 5
+        )
+        SELECT t.slug, agg.rev, agg.sales
+        FROM agg JOIN tools t ON t.id = agg.tool_id
+        ORDER BY agg.rev DESC""")
     for row in c.fetchall():
         print(f"  {row[0]}: ${row[1]:.2f} ({row[2]} sales)")
     
-    conn.close()
 
 def daily_run(args):
     """Run the full daily automation loop"""
@@ -347,8 +460,7 @@ def daily_run(args):
     
     # 2. Find winners
     print("\n� Identifying winners...")
-    import sqlite3
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = _get_conn()
     c = conn.cursor()
     c.execute("""SELECT t.slug FROM tools t
         JOIN metrics m ON t.id = m.tool_id
@@ -358,7 +470,6 @@ def daily_run(args):
         print(f"   Winner: {winner[0]}")
     else:
         print("   No winner yet (no sales data)")
-    conn.close()
     
     # 3. Generate content for top tools
     print("\n🎬 Generating content...")
@@ -369,7 +480,6 @@ def daily_run(args):
         slug = row[0]
         # Mock generate
         print(f"   Would generate content for: {slug}")
-    conn.close()
     
     print("\n✅ Daily run complete!")
     print("   Use 'python cli.py analytics_report' for full metrics")
@@ -16,19 +16,20 @@ if not creds_path:
     sys.exit(1)
 
 from google_auth_oauthlib.flow import InstalledAppFlow
-import pickle
+# Same scopes, token file and writer as the uploader that reads the token
+from upload_youtube import SCOPES, TOKEN_FILE, write_token
 
 flow = InstalledAppFlow.from_client_secrets_file(
     creds_path,
-    scopes=['https://www.googleapis.com/auth/youtube.upload']
+    scopes=SCOPES
 )
 
 print('Opening browser for OAuth authorization...')
-credentials = flow.run_local_server(port=8080, prompt='consent', open_browser=True)
+# port=0 lets the OS pick a free port for the redirect
+credentials = flow.run_local_server(port=0, prompt='consent', open_browser=True)
 
-# Save token
-token_path = Path(creds_path).parent / 'youtube_token.pickle'
-with open(token_path, 'wb') as f:
-    pickle.dump(credentials, f)
+# Save token (owner-only, written atomically)
+token_path = Path(creds_path).parent / TOKEN_FILE
+write_token(token_path, credentials)
 
 print(f'✅ OAuth complete! Token saved to {token_path}')
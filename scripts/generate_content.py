@@ -7,9 +7,10 @@ Uses FFmpeg to create slideshow-style demo videos
 import os
 import sys
 import json
-import subprocess
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 TOOL_TEMPLATES = Path(__file__).parent / "tool_templates"
 GENERATED_TOOLS = Path(__file__).parent.parent / "generated_tools"
@@ -60,27 +61,43 @@ def generate_script(tool_name, tool_niche):
     
     return templates[0]  # Return first template for now
 
-def generate_video_from_images(image_paths, output_path, duration_per_image=3):
-    """Create video from a list of images using FFmpeg"""
-    if not image_paths:
+@lru_cache(maxsize=1)
+def _h264_encoder():
+    """Pick a hardware H.264 encoder that actually works here, else libx264"""
+    import subprocess
+    
+    # Being listed by -encoders says nothing about a usable GPU/driver, so
+    # confirm with a one-frame test encode
+    candidates = ["h264_videotoolbox"] if sys.platform == "darwin" else ["h264_nvenc"]
+    for encoder in candidates:
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=s=256x256:d=0.04",
+            "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=10)
+            return encoder
+        except (OSError, subprocess.SubprocessError):
+            continue
+    return "libx264"
+
+def generate_video_from_images(image_pattern, output_path, duration_per_image=3):
+    """Create video from numbered images (e.g. slide_%d.png) using FFmpeg"""
+    import subprocess
+    
+    if not image_pattern:
         print("❌ No images to create video from")
         return False
     
-    # Create concat file
-    concat_file = output_path.parent / "concat.txt"
-    with open(concat_file, "w") as f:
-        for img in image_paths:
-            f.write(f"file '{img}'\n")
-            f.write(f"duration {duration_per_image}\n")
-    
-    # FFmpeg command to create video
+    # FFmpeg reads the numbered images directly via the image2 demuxer
     cmd = [
         "ffmpeg", "-y",
-        "-f", "concat",
-        "-safe", "0",
-        "-i", str(concat_file),
+        "-framerate", f"1/{duration_per_image}",
+        "-start_number", "0",
+        "-i", str(image_pattern),
         "-vf", "scale=1080:1920:force_original_aspect_ratio=decrease,pad=1080:1920:(ow-iw)/2:(oh-ih)/2",
-        "-c:v", "libx264",
+        "-c:v", _h264_encoder(),
         "-pix_fmt", "yuv420p",
         "-shortest",
         str(output_path)
@@ -94,63 +111,80 @@ def generate_video_from_images(image_paths, output_path, duration_per_image=3):
         print(f"❌ FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}")
         return False
 
-def generate_slideshow_video(tool_slug, tool_name, output_path):
+def _drawtext_escape(text):
+    """Escape text for a drawtext filter nested inside a filtergraph"""
+    for specials in ("\\%", "\\':", "\\'[],;"):
+        text = "".join("\\" + ch if ch in specials else ch for ch in text)
+    return text
+
+def generate_slideshow_video(tool_slug, tool_name, output_path, duration_per_slide=3, threads=0):
     """Generate a simple text-based slideshow video"""
+    import subprocess
     
-    # Create simple colored slides as images using sips (macOS) or Python
-    # For simplicity, we'll create a video directly with FFmpeg using color slides
+    # Render every slide inside a single FFmpeg filtergraph:
+    # color source + drawtext per slide, joined with the concat filter
     
     # Generate title slide, feature slides, CTA slide
-    slides = []
-    
-    # Colors for slides
-    colors = ["#667eea", "#764ba2", "#11998e", "#38ef7d"]
-    
-    for i, (text, color) in enumerate([
-        (f"📊 {tool_name}", colors[0]),
-        ("Calculate Your Profits", colors[1]),
-        ("Fast • Free • Accurate", colors[2]),
-        ("Link in Bio!", colors[3])
-    ]):
-        slide_file = CONTENT_RENDERS / f"slide_{i}.png"
-        slides.append(slide_file)
-        
-        # Create simple PNG with text using Python + PIL if available
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            img = Image.new('RGB', (1080, 1920), color=color)
-            draw = ImageDraw.Draw(img)
-            
-            # Draw text centered
-            # Use default font
-            draw.text((540, 960), text, fill="white", anchor="mm")
-            
-            img.save(slide_file)
-        except ImportError:
-            # PIL not available, skip slide creation
-            pass
-    
-    # Create video from slides
-    if slides and all(s.exists() for s in slides):
-        return generate_video_from_images([str(s) for s in slides], output_path)
-    else:
-        # Create a simple solid color video as fallback
+    slides = [
+        (f"📊 {tool_name}", "#667eea"),
+        ("Calculate Your Profits", "#764ba2"),
+        ("Fast • Free • Accurate", "#11998e"),
+        ("Link in Bio!", "#38ef7d")
+    ]
+    
+    filters = []
+    for i, (text, color) in enumerate(slides):
+        filters.append(
+            f"color=c={color}:s=1080x1920:d={duration_per_slide},"
+            f"drawtext=text={_drawtext_escape(text)}:fontcolor=white:fontsize=80:"
+            f"x=(w-tw)/2:y=(h-th)/2[v{i}]"
+        )
+    inputs = "".join(f"[v{i}]" for i in range(len(slides)))
+    filters.append(f"{inputs}concat=n={len(slides)}:v=1:a=0[out]")
+    
+    # A hardware encoder can still fail at runtime (e.g. too many
+    # concurrent sessions), so libx264 is always the second attempt
+    for encoder in dict.fromkeys([_h264_encoder(), "libx264"]):
+        if encoder == "libx264":
+            codec = ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
+                     "-threads", str(threads)]
+        else:
+            codec = ["-c:v", encoder]
         cmd = [
             "ffmpeg", "-y",
-            "-f", "lavfi",
-            "-i", f"color=c=#667eea:s=1080x1920:d=5",
-            "-c:v", "libx264",
+            "-filter_complex", ";".join(filters),
+            "-map", "[out]",
+            *codec,
             "-pix_fmt", "yuv420p",
             str(output_path)
         ]
         
         try:
             subprocess.run(cmd, check=True, capture_output=True)
-            print(f"✅ Video created (fallback): {output_path}")
+            print(f"✅ Video created: {output_path}")
             return True
-        except:
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️ Slideshow render failed ({encoder}): {e.stderr.decode() if e.stderr else str(e)}")
+        except FileNotFoundError:
+            print("❌ FFmpeg not found")
             return False
+    
+    # Create a simple solid color video as fallback (e.g. FFmpeg built without drawtext)
+    cmd = [
+        "ffmpeg", "-y",
+        "-f", "lavfi",
+        "-i", f"color=c=#667eea:s=1080x1920:d=5",
+        "-c:v", "libx264",
+        "-pix_fmt", "yuv420p",
+        str(output_path)
+    ]
+    
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+        print(f"✅ Video created (fallback): {output_path}")
+        return True
+    except:
+        return False
 
 def generate_thumbnail(tool_name, output_path):
     """Create a thumbnail image for the video"""
@@ -170,6 +204,28 @@ def generate_thumbnail(tool_name, output_path):
         print("⚠️ PIL not available, skipping thumbnail")
         return False
 
+def _render_prefix(tool_slug):
+    """Path prefix shared by every render of a tool"""
+    return os.path.join(str(CONTENT_RENDERS), f"{tool_slug}_")
+
+def _write_text(path, content):
+    """Write a small text file"""
+    with open(path, "w") as f:
+        f.write(content)
+
+def _render_one(tool_slug, tool_name, i, platform, threads=0):
+    """Render the video and thumbnail for one (count, platform) item"""
+    output_video = f"{_render_prefix(tool_slug)}{platform}_{i+1}.mp4"
+    thumbnail = os.path.join(str(THUMBNAILS), f"{tool_slug}_{platform}_{i+1}.jpg")
+    
+    # Generate video
+    if not generate_slideshow_video(tool_slug, tool_name, output_video, threads=threads):
+        return None
+    
+    # Generate thumbnail
+    generate_thumbnail(tool_name, thumbnail)
+    return output_video
+
 def generate_content_for_tool(tool_slug, platforms, count=1):
     """Generate content for a specific tool"""
     
@@ -195,32 +251,45 @@ def generate_content_for_tool(tool_slug, platforms, count=1):
     # Generate script
     script = generate_script(tool_name, niche)
     
-    # Generate content for each platform
-    for i in range(count):
-        for platform in platforms:
-            output_video = CONTENT_RENDERS / f"{tool_slug}_{platform}_{i+1}.mp4"
-            thumbnail = THUMBNAILS / f"{tool_slug}_{platform}_{i+1}.jpg"
-            
-            # Generate video
-            success = generate_slideshow_video(tool_slug, tool_name, output_video)
+    # Render every (count, platform) video concurrently; FFmpeg runs
+    # out-of-process so threads are enough to keep all cores busy
+    tasks = [(i, platform) for i in range(count) for platform in platforms]
+    max_workers = max(1, min(len(tasks), os.cpu_count() or 1))
+    # One encoder thread per video when several render side by side
+    threads = 1 if max_workers > 1 else 0
+    
+    render_prefix = _render_prefix(tool_slug)
+    
+    # Generate hashtags (identical for every item of this tool)
+    hashtags = f"#{tool_slug.replace('-', '')} #{niche} #free #calculator #tool #sidehustle"
+    
+    # Caption files are written by a separate I/O thread so the render
+    # loop never blocks on disk
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            ThreadPoolExecutor(max_workers=1) as io_pool:
+        futures = {
+            executor.submit(_render_one, tool_slug, tool_name, i, platform, threads): (i, platform)
+            for i, platform in tasks
+        }
+        writes = []
+        for future in as_completed(futures):
+            i, platform = futures[future]
+            output_video = future.result()
             
-            if success:
-                # Generate thumbnail
-                generate_thumbnail(tool_name, thumbnail)
-                
-                # Generate hashtags
-                hashtags = f"#{tool_slug.replace('-', '')} #{niche} #free #calculator #tool #sidehustle"
-                
+            if output_video:
                 print(f"✅ Generated {platform} content: {output_video}")
                 print(f"   Caption: {script[:100]}...")
                 print(f"   Hashtags: {hashtags}")
                 
                 # Save caption to file
-                caption_file = CONTENT_RENDERS / f"{tool_slug}_{platform}_{i+1}_caption.txt"
-                with open(caption_file, "w") as f:
-                    f.write(f"{script}\n\n{hashtags}")
+                caption_file = f"{render_prefix}{platform}_{i+1}_caption.txt"
+                writes.append(io_pool.submit(_write_text, caption_file, f"{script}\n\n{hashtags}"))
             else:
                 print(f"❌ Failed to generate video for {platform}")
+        
+        # Surface any caption write error instead of dropping it with the future
+        for write in writes:
+            write.result()
 
 def main():
     import argparse
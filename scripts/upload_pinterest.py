@@ -9,9 +9,19 @@ import sys
 import json
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 CONTENT_RENDERS = Path(__file__).parent.parent / "content" / "renders"
 
+# Shared session so repeated API calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
 def create_pin(image_path, title, description, link, board_id=None):
     """Create a pin on Pinterest"""
     
@@ -40,7 +50,7 @@ def create_pin(image_path, title, description, link, board_id=None):
     
     try:
         # Note: This is simplified - real implementation needs image upload first
-        response = requests.post(url, headers=headers, json=payload)
+        response = _SESSION.post(url, headers=headers, json=payload, timeout=(3.05, 30))
         
         if response.status_code in [200, 201]:
             data = response.json()
@@ -7,11 +7,39 @@ Requires: google-api-python-client, google-auth-oauthlib
 import os
 import sys
 import json
+import time
+import queue
+import random
+import stat
+import hashlib
+import mimetypes
+import tempfile
+import threading
+import socketserver
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import pickle
 from dotenv import load_dotenv
 
+# Parse the mimetypes database once at import rather than on first guess
+mimetypes.init()
+
+# Google client imports are paid once per process, not once per upload
+try:
+    from googleapiclient.discovery import build
+    from googleapiclient.http import MediaIoBaseUpload
+    from googleapiclient.errors import HttpError
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    import httplib2
+    import google_auth_httplib2
+    _GOOGLE_OK = True
+except ImportError:
+    _GOOGLE_OK = False
+
+INSTALL_HINT = "❌ Install: pip install google-api-python-client google-auth-oauthlib"
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 # Add parent to path
@@ -19,110 +47,598 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 CONTENT_RENDERS = Path(__file__).parent.parent / "content" / "renders"
 
-def get_credentials(creds_path):
-    """Get OAuth credentials"""
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
+SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+# Written by scripts/auth_youtube.py next to the client secret JSON
+TOKEN_FILE = "youtube_token.json"
+# Status polls need read access, which the upload-only scope lacks, so
+# they use a separate read-only token
+STATUS_SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
+STATUS_TOKEN_FILE = "youtube_readonly_token.json"
+
+def _env_chunksize():
+    """Read YOUTUBE_UPLOAD_CHUNKSIZE, falling back to -1 on a bad value"""
+    raw = os.getenv("YOUTUBE_UPLOAD_CHUNKSIZE") or "-1"
+    try:
+        chunksize = int(raw)
+    except ValueError:
+        chunksize = 0
+    if chunksize != -1 and chunksize <= 0:
+        print(f"⚠️ Ignoring YOUTUBE_UPLOAD_CHUNKSIZE={raw!r}: use -1 or a positive byte count")
+        return -1
+    return chunksize
+
+# -1 streams the whole file in one request; set e.g. 52428800 (50 MB)
+# to upload in chunks on memory-constrained machines
+UPLOAD_CHUNKSIZE = _env_chunksize()
+RETRIABLE_STATUS = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+MAX_RETRIES = 5
+# Upper bound on any retry sleep, including a server-sent Retry-After
+MAX_RETRY_DELAY = 60
+HTTP_TIMEOUT = 60
+# Read the media file in 4 MiB blocks instead of the 8 KiB default
+UPLOAD_BUFFER = 4 * 1024 * 1024
+# Concurrent uploads in a batch; lower this if the project's YouTube
+# quota starts rejecting parallel requests
+MAX_CONCURRENT = int(os.getenv("YT_MAX_CONCURRENT", "2"))
+
+# YouTube snippet limits; oversized metadata is rejected with a 400
+# only after the whole media body has been sent
+MAX_TITLE_LEN = 100
+MAX_DESCRIPTION_LEN = 5000
+MAX_TAGS_LEN = 500
+MAX_TAG_LEN = 30
+
+DEFAULT_DESCRIPTION = "Check out this free tool!"
+DEFAULT_TAGS = ["free", "tool", "calculator"]
+
+# Content hash -> URL of every video already uploaded, so re-runs skip them
+UPLOAD_CACHE = CONTENT_RENDERS / ".uploaded.json"
+_UPLOAD_CACHE = None
+_UPLOAD_CACHE_LOCK = threading.Lock()
+
+# Credentials loaded once per process and shared by every upload
+_CREDENTIALS = None
+_CREDENTIALS_LOCK = threading.Lock()
+
+# Service built once per process and reused by every sequential upload
+_SERVICE = None
+_SERVICE_LOCK = threading.Lock()
+# Per-thread services for batch workers (one build per worker thread)
+_THREAD_SERVICES = threading.local()
+
+def write_token(token_path, credentials):
+    """Atomically write a token readable only by the owner
     
-    token_path = Path(creds_path).parent / "token.pickle"
+    A crash mid-write would otherwise leave a truncated token and force
+    a full browser re-auth on the next run.
+    """
+    with tempfile.NamedTemporaryFile("w", dir=token_path.parent, suffix=".tmp",
+                                     delete=False) as f:
+        f.write(credentials.to_json())
+    os.chmod(f.name, 0o600)
+    os.replace(f.name, token_path)
+
+def _load_token(token_path, scopes=SCOPES):
+    """Load a JSON token, migrating a legacy .pickle token once if needed"""
+    if token_path.exists():
+        return Credentials.from_authorized_user_info(
+            json.loads(token_path.read_text()), scopes=scopes
+        )
+    
+    legacy_path = token_path.with_suffix(".pickle")
+    if legacy_path.exists():
+        with open(legacy_path, 'rb') as f:
+            credentials = pickle.load(f)
+        write_token(token_path, credentials)
+        legacy_path.unlink()
+        return credentials
+    
+    return None
+
+def _authorize(creds_path, token_file, scopes):
+    """Load the saved token for scopes, running the OAuth flow if there is none"""
+    token_path = Path(creds_path).parent / token_file
     
     # If we have a saved token, use it
-    if token_path.exists():
-        with open(token_path, 'rb') as f:
-            return pickle.load(f)
+    credentials = _load_token(token_path, scopes)
+    if credentials is not None:
+        return credentials
+    
+    # The browser flow would block forever in CI/daemon runs
+    if not sys.stdin.isatty():
+        print(f"❌ No YouTube token at {token_path} and no terminal for OAuth.")
+        print("   Run scripts/auth_youtube.py interactively first.")
+        return None
+    
+    from google_auth_oauthlib.flow import InstalledAppFlow
     
     # Otherwise, run OAuth flow
     flow = InstalledAppFlow.from_client_secrets_file(
         creds_path,
-        scopes=['https://www.googleapis.com/auth/youtube.upload']
+        scopes=scopes
     )
     
-    credentials = flow.run_local_server(port=8080)
+    # port=0 lets the OS pick a free port for the redirect
+    credentials = flow.run_local_server(port=0)
     
     # Save for next time
-    with open(token_path, 'wb') as f:
-        pickle.dump(credentials, f)
-    
+    write_token(token_path, credentials)
     return credentials
 
-def upload_to_youtube(video_path, title, description, tags, category_id="22"):
-    """Upload video to YouTube"""
+def get_credentials(creds_path):
+    """Get OAuth credentials (loaded once per process)"""
+    global _CREDENTIALS
+    if not _GOOGLE_OK:
+        raise ImportError(INSTALL_HINT)
+    
+    with _CREDENTIALS_LOCK:
+        if _CREDENTIALS is None:
+            _CREDENTIALS = _authorize(creds_path, TOKEN_FILE, SCOPES)
+        return _CREDENTIALS
+
+def get_status_credentials(creds_path):
+    """Get read-only OAuth credentials for StatusBatcher"""
+    if not _GOOGLE_OK:
+        raise ImportError(INSTALL_HINT)
+    return _authorize(creds_path, STATUS_TOKEN_FILE, STATUS_SCOPES)
+
+def _upload_token_path():
+    """Path of the saved upload token, or None if the client secret is unset"""
+    creds_path = os.getenv("YOUTUBE_CLIENT_SECRET_JSON_PATH")
+    if not creds_path:
+        return None
+    return Path(creds_path).parent / TOKEN_FILE
+
+def _save_upload_token(credentials):
+    """Atomically persist credentials so later runs skip the refresh"""
+    token_path = _upload_token_path()
+    if token_path is not None:
+        write_token(token_path, credentials)
+
+def _refresh_upload_token(credentials):
+    """Refresh an expired access token and save it for the next process
+    
+    Upload workers share one Credentials object, so the check and the
+    refresh happen under the lock: the first thread refreshes and the
+    rest see a valid token instead of each spending the refresh token.
+    Only the credentials loaded from youtube_token.json are written back
+    there; caller-supplied credentials are refreshed in memory only.
+    """
+    with _CREDENTIALS_LOCK:
+        if credentials.expired and credentials.refresh_token:
+            credentials.refresh(Request())
+            if credentials is _CREDENTIALS:
+                _save_upload_token(credentials)
+
+def load_upload_credentials():
+    """Return the shared upload credentials, or None if unconfigured"""
+    creds_path = os.getenv("YOUTUBE_CLIENT_SECRET_JSON_PATH")
+    if not creds_path:
+        print("❌ YOUTUBE_CLIENT_SECRET_JSON_PATH not set")
+        return None
+    return get_credentials(creds_path)
+
+def _build_service(credentials):
+    """Build a YouTube service from the bundled discovery document
+    
+    The service owns one persistent authorized connection, so uploads
+    through it reuse the same TCP+TLS session. httplib2 is not
+    thread-safe: never share one service between threads.
+    """
+    http = google_auth_httplib2.AuthorizedHttp(
+        credentials, http=httplib2.Http(cache=None, timeout=HTTP_TIMEOUT)
+    )
+    return build('youtube', 'v3', http=http,
+                 cache_discovery=False, static_discovery=True)
+
+def get_service():
+    """Return the process-wide YouTube service, building it on first use"""
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            credentials = load_upload_credentials()
+            if credentials is None:
+                return None
+            _SERVICE = _build_service(credentials)
+        return _SERVICE
+
+def _thread_service(credentials):
+    """YouTube service for the current worker thread, built on its first upload"""
+    if getattr(_THREAD_SERVICES, "credentials", None) is not credentials:
+        _THREAD_SERVICES.service = _build_service(credentials)
+        _THREAD_SERVICES.credentials = credentials
+    return _THREAD_SERVICES.service
+
+def _fingerprint(video_path):
+    """SHA-256 of the video file contents"""
+    with open(video_path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        # Python < 3.11
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(UPLOAD_BUFFER), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
+def _load_upload_cache():
+    """Read the idempotency cache, starting empty if it is missing or unreadable"""
+    if not UPLOAD_CACHE.exists():
+        return {}
     try:
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaFileUpload
-        from google.oauth2.credentials import Credentials
-        import pickle
+        cache = json.loads(UPLOAD_CACHE.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ Ignoring unreadable upload cache {UPLOAD_CACHE}: {e}")
+        return {}
+    if not isinstance(cache, dict):
+        print(f"⚠️ Ignoring malformed upload cache {UPLOAD_CACHE}")
+        return {}
+    return cache
+
+def _cached_upload(fingerprint):
+    """URL of a previous upload with the same contents, if any"""
+    global _UPLOAD_CACHE
+    with _UPLOAD_CACHE_LOCK:
+        if _UPLOAD_CACHE is None:
+            _UPLOAD_CACHE = _load_upload_cache()
+        return _UPLOAD_CACHE.get(fingerprint)
+
+def _remember_upload(fingerprint, url):
+    """Record a finished upload in the idempotency cache"""
+    with _UPLOAD_CACHE_LOCK:
+        _UPLOAD_CACHE[fingerprint] = url
+        UPLOAD_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = UPLOAD_CACHE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(_UPLOAD_CACHE))
+        os.replace(tmp_path, UPLOAD_CACHE)
+
+def _sanitize_snippet(title, description, tags):
+    """Trim title, description and tags to YouTube's limits before uploading"""
+    title = title.replace("<", "").replace(">", "")[:MAX_TITLE_LEN]
+    description = description.replace("<", "").replace(">", "")[:MAX_DESCRIPTION_LEN]
+    
+    dropped = [t for t in tags if len(t) > MAX_TAG_LEN]
+    tags = [t for t in tags if len(t) <= MAX_TAG_LEN]
+    while tags and sum(len(t) + 2 for t in tags) > MAX_TAGS_LEN:
+        dropped.append(tags.pop())
+    
+    if dropped:
+        print(f"⚠️ Dropped tags over YouTube's limits: {', '.join(dropped)}")
+    
+    return title, description, tags
+
+def _video_mimetype(video_path):
+    """Media type for a video file from its extension, defaulting to MP4"""
+    suffix = os.path.splitext(video_path)[1].lower()
+    return mimetypes.types_map.get(suffix) or "video/mp4"
+
+def _is_transient(error):
+    """Whether an HttpError is worth retrying (5xx, 429 or a rate limit)"""
+    if error.resp.status in RETRIABLE_STATUS:
+        return True
+    return error.resp.status == 403 and any(r in (error.content or b"") for r in RATE_LIMIT_REASONS)
+
+def _retry(fn, tries=MAX_RETRIES):
+    """Call fn, retrying transient errors with exponential backoff and jitter
+    
+    Honors the server's Retry-After header when one is sent, capped at
+    MAX_RETRY_DELAY like the computed backoff.
+    """
+    for attempt in range(tries):
+        try:
+            return fn()
+        except HttpError as e:
+            if attempt == tries - 1 or not _is_transient(e):
+                raise
+            retry_after = e.resp.get("retry-after", "")
+            if retry_after.isdigit():
+                delay = min(MAX_RETRY_DELAY, int(retry_after))
+            else:
+                delay = min(MAX_RETRY_DELAY, 2 ** attempt) + random.random()
+        except (ConnectionError, TimeoutError):
+            if attempt == tries - 1:
+                raise
+            delay = min(MAX_RETRY_DELAY, 2 ** attempt) + random.random()
+        print(f"   Transient error, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+def _execute_upload(youtube, video_path, body):
+    """Stream the video through a resumable insert and return the response"""
+    with open(video_path, 'rb', buffering=UPLOAD_BUFFER) as fh:
+        # Resumable upload so transient failures resume instead of restarting
+        media = MediaIoBaseUpload(fh, mimetype=_video_mimetype(video_path), chunksize=UPLOAD_CHUNKSIZE,
+                                  resumable=True)
         
-        # Load credentials
-        creds_path = os.getenv("YOUTUBE_CLIENT_SECRET_JSON_PATH")
-        if not creds_path:
-            print("❌ YOUTUBE_CLIENT_SECRET_JSON_PATH not set")
-            return None
+        request = youtube.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+            fields="id"  # only the video id is used
+        )
         
-        token_path = Path(creds_path).parent / "youtube_token.pickle"
+        response = None
+        while response is None:
+            # A failed chunk resumes from the last byte the server acknowledged
+            status, response = _retry(request.next_chunk)
+            if status:
+                print(f"   Uploaded {int(status.progress() * 100)}%")
+        
+        return response
+
+def upload_to_youtube(video_path, title, description, tags, category_id="22", credentials=None):
+    """Upload video to YouTube"""
+    if not _GOOGLE_OK:
+        print(INSTALL_HINT)
+        return None
+    
+    try:
+        # Skip files that were already uploaded
+        fingerprint = _fingerprint(video_path)
+        url = _cached_upload(fingerprint)
+        if url:
+            print(f"⏭️ Already uploaded: {url}")
+            return url
         
-        if token_path.exists():
-            with open(token_path, 'rb') as f:
-                credentials = pickle.load(f)
+        if credentials is None:
+            # Sequential callers share the cached service
+            youtube = get_service()
+            if youtube is None:
+                return None
+            credentials = _CREDENTIALS
         else:
-            print("❌ No YouTube credentials. Run OAuth setup first.")
-            return None
+            # Batch workers get their own service (the client is not thread-safe)
+            youtube = _thread_service(credentials)
         
-        # Build YouTube service
-        youtube = build('youtube', 'v3', credentials=credentials)
+        title, description, tags = _sanitize_snippet(title, description, tags)
         
-        # Upload
-        request = youtube.videos().insert(
-            part="snippet,status",
-            body={
-                "snippet": {
-                    "title": title,
-                    "description": description,
-                    "tags": tags,
-                    "categoryId": category_id,
-                    "privacyStatus": "public"
-                },
-                "status": {
-                    "selfDeclaredMadeForKids": False
-                }
+        body = {
+            "snippet": {
+                "title": title,
+                "description": description,
+                "tags": tags,
+                "categoryId": category_id,
+                "privacyStatus": "public"
             },
-            media_body=MediaFileUpload(video_path)
-        )
-        
-        response = request.execute()
+            "status": {
+                "selfDeclaredMadeForKids": False
+            }
+        }
+        # Refresh an expired token now rather than on a 401 after the
+        # media body has already been sent
+        _refresh_upload_token(credentials)
+        response = _execute_upload(youtube, video_path, body)
         
         video_id = response['id']
         print(f"✅ Uploaded to YouTube: https://youtube.com/watch?v={video_id}")
         
-        return f"https://youtube.com/watch?v={video_id}"
+        url = f"https://youtube.com/watch?v={video_id}"
+        _remember_upload(fingerprint, url)
+        
+        return url
     
-    except ImportError:
-        print("❌ Install: pip install google-api-python-client google-auth-oauthlib")
-        return None
     except Exception as e:
         print(f"❌ Upload failed: {e}")
         return None
 
+def upload_many(items, max_workers=MAX_CONCURRENT):
+    """Upload (video_path, title, description, tags) items concurrently
+    
+    Returns a dict mapping each video path to its URL (or None on failure).
+    """
+    if not _GOOGLE_OK:
+        print(INSTALL_HINT)
+        return {}
+    
+    credentials = load_upload_credentials()
+    if credentials is None:
+        return {}
+    # Refresh before fanning out so workers start with a valid token
+    _refresh_upload_token(credentials)
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(upload_to_youtube, path, title, description, tags,
+                            credentials=credentials): path
+            for path, title, description, tags in items
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return results
+
+class StatusBatcher:
+    """Coalesce per-video status polls into batched videos().list calls
+    
+    Ids submitted within one window (default 500 ms) are fetched together,
+    up to 50 per request, so N polls cost ceil(N/50) API calls. The
+    batcher builds its own service and only uses it from its own thread.
+    The upload token cannot read processingDetails, so pass read-only
+    credentials:
+    
+        credentials = get_status_credentials(creds_path)
+        with StatusBatcher(credentials) as batcher:
+            item = batcher.submit(video_id).result()
+    """
+    
+    def __init__(self, credentials, window_ms=500, max_batch=50):
+        if not any(credentials.has_scopes([scope]) for scope in
+                   STATUS_SCOPES + ['https://www.googleapis.com/auth/youtube']):
+            raise ValueError("StatusBatcher needs youtube or youtube.readonly credentials; "
+                             "use get_status_credentials()")
+        self._youtube = _build_service(credentials)
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def submit(self, video_id):
+        """Queue a status lookup; the Future resolves to the video resource or None"""
+        future = Future()
+        self._queue.put((video_id, future))
+        return future
+    
+    def close(self):
+        """Flush pending lookups and stop the background thread"""
+        self._closed.set()
+        self._thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            self._closed.wait(self._window)
+            while True:
+                batch = []
+                while len(batch) < self._max_batch:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    break
+                self._dispatch(batch)
+    
+    def _dispatch(self, batch):
+        ids = ",".join(dict.fromkeys(video_id for video_id, _ in batch))
+        try:
+            response = self._youtube.videos().list(
+                part="status,processingDetails", id=ids
+            ).execute(num_retries=MAX_RETRIES)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        items = {item["id"]: item for item in response.get("items", [])}
+        for video_id, future in batch:
+            future.set_result(items.get(video_id))
+
+def _job_item(job):
+    """Turn a JSON job ({path|video, title, description, tags}) into an upload item"""
+    tags = job.get("tags") or DEFAULT_TAGS
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return (
+        job.get("path") or job["video"],
+        job["title"],
+        job.get("description") or DEFAULT_DESCRIPTION,
+        tags
+    )
+
+def read_manifest(manifest):
+    """Read upload items from a JSONL manifest file, or stdin for '-'"""
+    f = sys.stdin if manifest == "-" else open(manifest)
+    try:
+        return [_job_item(json.loads(line)) for line in f if line.strip()]
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+class _UploadJobHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON upload jobs on one daemon connection"""
+    
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                path, title, description, tags = _job_item(json.loads(line))
+                url = upload_to_youtube(path, title, description, tags)
+                reply = {"video": path, "url": url}
+            except (ValueError, KeyError) as e:
+                reply = {"error": f"invalid job: {e}"}
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+
+def _is_stale_socket(socket_path):
+    """True if socket_path is a leftover socket; False if nothing is there
+    
+    Raises FileExistsError for anything else so a mistyped path (e.g. a
+    manifest) is never deleted.
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+    return True
+
+def serve(socket_path):
+    """Run as a daemon that reuses one service for every upload job"""
+    if _is_stale_socket(socket_path):
+        os.unlink(socket_path)
+    
+    with socketserver.UnixStreamServer(socket_path, _UploadJobHandler) as server:
+        print(f"🟢 Listening for upload jobs on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            Path(socket_path).unlink(missing_ok=True)
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="YouTube Uploader")
-    parser.add_argument("--video", required=True, help="Path to video file")
-    parser.add_argument("--title", required=True, help="Video title")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--video", nargs="+", help="Path(s) to video file(s)")
+    source.add_argument("--manifest",
+                        help="JSONL file of {path, title, description, tags} jobs ('-' for stdin)")
+    source.add_argument("--daemon", metavar="SOCKET",
+                        help="Serve JSON upload jobs on a Unix socket instead of uploading once")
+    parser.add_argument("--title", help="Video title")
     parser.add_argument("--description", help="Video description")
     parser.add_argument("--tags", help="Comma-separated tags")
     
     args = parser.parse_args()
     
-    description = args.description or "Check out this free tool!"
-    tags = args.tags.split(",") if args.tags else ["free", "tool", "calculator"]
+    if args.daemon:
+        try:
+            _is_stale_socket(args.daemon)
+        except FileExistsError as e:
+            parser.error(f"--daemon: {e}")
+        serve(args.daemon)
+        return
     
-    result = upload_to_youtube(args.video, args.title, description, tags)
+    if args.manifest:
+        items = read_manifest(args.manifest)
+        results = upload_many(items)
+        for path, *_ in items:
+            if results.get(path):
+                print(f"🎉 Success: {path} -> {results[path]}")
+            else:
+                print(f"❌ Failed to upload {path}")
+        return
     
-    if result:
-        print(f"🎉 Success: {result}")
-    else:
-        print("❌ Failed to upload")
+    if not args.title:
+        parser.error("--title is required with --video")
+    
+    description = args.description or DEFAULT_DESCRIPTION
+    tags = args.tags.split(",") if args.tags else DEFAULT_TAGS
+    
+    if len(args.video) == 1:
+        result = upload_to_youtube(args.video[0], args.title, description, tags)
+        
+        if result:
+            print(f"🎉 Success: {result}")
+        else:
+            print("❌ Failed to upload")
+        return
+    
+    results = upload_many([(video, args.title, description, tags) for video in args.video])
+    for video in args.video:
+        if results.get(video):
+            print(f"🎉 Success: {video} -> {results[video]}")
+        else:
+            print(f"❌ Failed to upload {video}")
 
 if __name__ == "__main__":
     main()
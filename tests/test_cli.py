@@ -0,0 +1,76 @@
+"""Tests for the content posting queue in cli.py"""
+
+import io
+import sys
+import tempfile
+import types
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cli
+
+
+class PostContentTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+
+        for name, value in (("DB_PATH", root / "factory.db"),
+                            ("GENERATED_TOOLS", root / "generated_tools"),
+                            ("CONTENT_RENDERS", root / "renders"),
+                            ("_CONN", None)):
+            patcher = mock.patch.object(cli, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: cli._CONN and cli._CONN.close())
+
+        with redirect_stdout(io.StringIO()):
+            cli.init_db()
+        self.conn = cli._get_conn()
+        self.conn.execute("INSERT INTO tools (slug, name, niche, build_path, status) "
+                          "VALUES ('roi-calc', 'ROI Calc', 'general', '', 'built')")
+        self.conn.executemany(
+            "INSERT INTO content (tool_id, platform, video_path, caption, hashtags, status) "
+            "VALUES (1, ?, '', '', '', 'generated')",
+            [("youtube",), ("pinterest",), ("youtube",)]
+        )
+
+    def statuses(self):
+        return dict(self.conn.execute("SELECT id, status FROM content"))
+
+    def post(self, platforms):
+        with redirect_stdout(io.StringIO()):
+            cli.post_content(types.SimpleNamespace(platform=platforms))
+
+    def test_posts_oldest_item_per_platform(self):
+        self.post("youtube,pinterest")
+
+        self.assertEqual(self.statuses(), {1: "posted", 2: "posted", 3: "generated"})
+
+    def test_failure_returns_unposted_claims_to_queue(self):
+        real_print = print
+
+        def interrupt_on_pinterest(*args, **kwargs):
+            if args and str(args[0]).startswith("📌"):
+                raise KeyboardInterrupt
+            real_print(*args, **kwargs)
+
+        with mock.patch("builtins.print", interrupt_on_pinterest):
+            with self.assertRaises(KeyboardInterrupt):
+                self.post("youtube,pinterest")
+
+        self.assertEqual(self.statuses(), {1: "posted", 2: "generated", 3: "generated"})
+        self.assertFalse(self.conn.in_transaction)
+
+        # The released row is picked up by the next run
+        self.post("pinterest")
+        self.assertEqual(self.statuses()[2], "posted")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Tests for the FFmpeg filtergraph helpers in scripts/generate_content.py"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate_content import _drawtext_escape
+
+
+class DrawtextEscapeTest(unittest.TestCase):
+    def test_plain_text_is_unchanged(self):
+        self.assertEqual(_drawtext_escape("📊 Fast • Free • Accurate!"),
+                         "📊 Fast • Free • Accurate!")
+
+    def test_percent_is_escaped_for_text_expansion(self):
+        # \% for expansion, its backslash doubled for the option parser,
+        # then each of those doubled again for the filtergraph
+        self.assertEqual(_drawtext_escape("100%"), r"100\\\\%")
+
+    def test_colon_and_quote_are_escaped_for_the_option_parser(self):
+        self.assertEqual(_drawtext_escape("a:b"), r"a\\:b")
+        self.assertEqual(_drawtext_escape("it's"), r"it\\\'s")
+
+    def test_filtergraph_separators_are_escaped(self):
+        self.assertEqual(_drawtext_escape("a,b;c[d]"), r"a\,b\;c\[d\]")
+
+    def test_backslash_is_escaped_at_every_level(self):
+        self.assertEqual(_drawtext_escape("a\\b"), "a" + "\\" * 8 + "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
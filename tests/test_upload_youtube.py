@@ -0,0 +1,40 @@
+"""Regression tests for YouTube upload request encoding"""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+try:
+    import upload_youtube
+except ImportError:
+    upload_youtube = None
+
+
+@unittest.skipUnless(upload_youtube and upload_youtube._GOOGLE_OK,
+                     "upload dependencies not installed")
+class UploadRequestEncodingTest(unittest.TestCase):
+    def test_non_ascii_metadata_survives_the_wire(self):
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.http import MediaIoBaseUpload
+        
+        youtube = upload_youtube._build_service(Credentials(token="test"))
+        title = "🔥 Free café ROI Calculator – 100% free"
+        media = MediaIoBaseUpload(io.BytesIO(b"\0" * 16), mimetype="video/mp4", resumable=True)
+        request = youtube.videos().insert(
+            part="snippet,status", body={"snippet": {"title": title}}, media_body=media
+        )
+        
+        # http.client encodes str bodies as Latin-1, and httplib2 sets
+        # Content-Length from len(body)
+        body = request.body
+        wire = body if isinstance(body, bytes) else body.encode("latin-1")
+        self.assertEqual(len(wire), len(body))
+        self.assertEqual(json.loads(wire.decode("utf-8"))["snippet"]["title"], title)
+
+
+if __name__ == "__main__":
+    unittest.main()